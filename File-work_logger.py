@@ -15,53 +15,68 @@ EXE 빌드:
   py -m PyInstaller -F -w file_work_logger_tk.py
 """
 
-import os, sys, sqlite3, csv, threading, subprocess, platform, traceback
-from datetime import datetime, timedelta
+import os, re, sys, time, calendar, sqlite3, csv, threading, subprocess, platform, traceback, atexit, queue, contextlib, collections, functools
+from datetime import datetime, date, timedelta
 from pathlib import Path
 import argparse
 
 # --- Optional deps ---
 try:
     from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
     from watchdog.events import FileSystemEventHandler
 except Exception:
-    Observer = None
+    Observer = PollingObserver = None
     class FileSystemEventHandler: pass  # type: ignore
 
-try:
-    from win10toast import ToastNotifier
-except Exception:
-    ToastNotifier = None
-
 # --- tkinter / ttk ---
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 APP_NAME = "WorkAssistantTK"
-DB_DIR = Path(os.getenv("APPDATA", str(Path.home()/".work_assistant"))) / APP_NAME
+_HOME = Path.home()
+_HOME_REAL = os.path.normcase(os.path.realpath(_HOME))
+DB_DIR = Path(os.getenv("APPDATA", str(_HOME/".work_assistant"))) / APP_NAME
 DB_PATH = DB_DIR / "work_assistant.db"
 DEFAULT_REMIND_HOUR = 9
 
 # ---------- Crash log ----------
-LOG_DIR = Path(os.getenv("LOCALAPPDATA", str(Path.home()))) / "WorkAssistant"
+LOG_DIR = Path(os.getenv("LOCALAPPDATA", str(_HOME))) / "WorkAssistant"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_PATH = LOG_DIR / "latest.log"
+_log_fh = None; _log_lock = threading.Lock()
 def log_line(msg:str):
+    # 로그 파일은 처음 쓸 때 한 번만 열고(줄 단위 버퍼) 종료 시 닫음
+    global _log_fh
     try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(f"[{datetime.now().isoformat(timespec='seconds')}] {msg}\n")
+        with _log_lock:
+            if _log_fh is None:
+                _log_fh = open(LOG_PATH, "a", encoding="utf-8", buffering=1)
+                atexit.register(_log_fh.close)
+            _log_fh.write(f"[{datetime.now().isoformat(timespec='seconds')}] {msg}\n")
     except Exception:
         pass
 
 # ---------- DB ----------
-SCHEMA_SQL = """
+RETENTION_DAYS = 90  # 이보다 오래된 파일 이벤트는 자동 삭제
+SCHEMA_SQL = f"""
 CREATE TABLE IF NOT EXISTS file_events(
  id INTEGER PRIMARY KEY AUTOINCREMENT,
  file_name TEXT, event_time TEXT, ext TEXT, dir TEXT,
  event_type TEXT, src_path TEXT, dest_path TEXT
 );
-CREATE INDEX IF NOT EXISTS idx_events_time ON file_events(event_time);
 CREATE INDEX IF NOT EXISTS idx_events_name ON file_events(file_name);
+-- 확장자 필터용 (기간 조건·시간순 정렬까지 같은 인덱스로)
+CREATE INDEX IF NOT EXISTS idx_events_ext ON file_events(ext, event_time);
+-- 검색 화면용 커버링 인덱스: 기간 + 이벤트/확장자 필터와 표시 컬럼(id는 rowid로 포함)을 인덱스만으로 처리
+CREATE INDEX IF NOT EXISTS idx_events_cover ON file_events(event_time, event_type, ext, file_name, dir);
+DROP INDEX IF EXISTS idx_events_time;
+DROP INDEX IF EXISTS idx_events_time_ext_type;
+-- 보관 기간 지난 이벤트 정리: 1000건 저장마다 한 번 (보관 기간 변경 반영 위해 매번 다시 생성)
+DROP TRIGGER IF EXISTS trg_events_retention;
+CREATE TRIGGER trg_events_retention AFTER INSERT ON file_events WHEN NEW.id % 1000 = 0 BEGIN
+ DELETE FROM file_events WHERE event_time < strftime('%Y-%m-%dT%H:%M:%S','now','localtime','-{RETENTION_DAYS} days');
+END;
 
 CREATE TABLE IF NOT EXISTS tasks(
  id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -76,25 +91,126 @@ CREATE TABLE IF NOT EXISTS settings(
 );
 INSERT OR IGNORE INTO settings(id,watch_dir,extensions,remind_hour) VALUES(1,'','',9);
 """
-def db_connect():
+# 키워드 검색용 FTS5 색인 (trigram: 기존 LIKE '%kw%'처럼 부분 문자열 일치, 3글자 이상)
+FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS file_events_fts USING fts5(
+ file_name, dir, event_type, content='file_events', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS file_events_fts_ai AFTER INSERT ON file_events BEGIN
+ INSERT INTO file_events_fts(rowid,file_name,dir,event_type) VALUES(new.id,new.file_name,new.dir,new.event_type);
+END;
+CREATE TRIGGER IF NOT EXISTS file_events_fts_ad AFTER DELETE ON file_events BEGIN
+ INSERT INTO file_events_fts(file_events_fts,rowid,file_name,dir,event_type) VALUES('delete',old.id,old.file_name,old.dir,old.event_type);
+END;
+CREATE TRIGGER IF NOT EXISTS file_events_fts_au AFTER UPDATE ON file_events BEGIN
+ INSERT INTO file_events_fts(file_events_fts,rowid,file_name,dir,event_type) VALUES('delete',old.id,old.file_name,old.dir,old.event_type);
+ INSERT INTO file_events_fts(rowid,file_name,dir,event_type) VALUES(new.id,new.file_name,new.dir,new.event_type);
+END;
+"""
+FTS_MIN_LEN = 3
+FTS_ENABLED = False
+READER_POOL_SIZE = 4
+STMT_CACHE_SIZE = 256   # 연결별 준비된 statement 캐시 (검색 SQL shape별 + 고정 INSERT)
+
+def db_connect_writer():
     DB_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    # isolation_level=None: 트랜잭션은 write_txn()으로 직접 관리 (BEGIN IMMEDIATE)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=STMT_CACHE_SIZE)
+    conn.execute("PRAGMA busy_timeout=5000;")        # 쓰기 락 충돌 시 바로 SQLITE_BUSY 대신 최대 5초 재시도
     conn.execute("PRAGMA journal_mode=WAL;")
     conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA mmap_size=268435456;")    # 256MB: 검색 시 read() 호출 대신 메모리 매핑
+    conn.execute("PRAGMA cache_size=-20000;")      # 페이지 캐시 20MB
+    conn.execute("PRAGMA temp_store=MEMORY;")      # ORDER BY 정렬용 임시 데이터를 메모리에
+    conn.execute("PRAGMA wal_autocheckpoint=0;")     # 자동 체크포인트 끔 → 쓰기 없는 유휴 시점에 직접 수행
     return conn
 
+@contextlib.contextmanager
+def write_txn(conn):
+    # 시작 시점에 쓰기 락을 잡아서 트랜잭션 도중 SQLITE_BUSY로 실패하지 않게
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK"); raise
+
+# 읽기 전용 연결 (UI 검색/내보내기용) — 쓰기는 단일 writer 연결 + 락으로만
+def db_connect_reader():
+    conn = sqlite3.connect(f"{DB_PATH.as_uri()}?mode=ro", uri=True, check_same_thread=False, cached_statements=STMT_CACHE_SIZE)
+    conn.execute("PRAGMA query_only=ON;")
+    conn.execute("PRAGMA busy_timeout=5000;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    conn.execute("PRAGMA cache_size=-20000;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    return conn
+
+# 읽기 연결 풀 (1 writer + N readers): with pool.borrow() as conn: ...
+class ReaderPool:
+    def __init__(self, size=READER_POOL_SIZE):
+        self._pool=queue.LifoQueue()
+        for _ in range(size): self._pool.put(None)  # 연결은 처음 빌릴 때 생성
+    @contextlib.contextmanager
+    def borrow(self):
+        conn=self._pool.get()
+        try:
+            if conn is None: conn=db_connect_reader()
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+def init_schema(conn):
+    global FTS_ENABLED
+    conn.executescript(SCHEMA_SQL)
+    # FTS5/trigram 미지원 SQLite면 LIKE 검색으로 동작
+    try:
+        fresh = conn.execute("SELECT 1 FROM sqlite_master WHERE name='file_events_fts'").fetchone() is None
+        conn.executescript(FTS_SQL)
+        if fresh:  # 처음 만들 때 기존 로그도 색인
+            conn.execute("INSERT INTO file_events_fts(file_events_fts) VALUES('rebuild')")
+        FTS_ENABLED = True
+    except sqlite3.Error as e:
+        log_line(f"fts5 unavailable: {e}")
+    # 시작 시 통계 갱신 → 기간 검색에 시간 인덱스를 고르도록 (큰 DB에서도 빠르게 표본만)
+    conn.execute("PRAGMA analysis_limit=1000;")
+    conn.execute("ANALYZE;")
+
 # ---------- Utilities ----------
+def normalize_time_bound(v:str, end:bool=False) -> str:
+    # 'YYYY-MM-DD' → 그날 시작/끝, 'YYYY-MM-DD HH:MM:SS' → 'T' 구분자로 (event_time 형식과 맞춤)
+    v=v.strip()
+    if len(v)==10: return v+('T23:59:59' if end else 'T00:00:00')
+    return v.replace(' ','T',1)
+
 def is_safe_watch_dir(path_str: str) -> bool:
     try:
-        p = Path(path_str).resolve(); home = Path.home().resolve()
-        return (home in p.parents) or (p == home)
+        # 문자열 비교만으로 홈 폴더(또는 그 하위)인지 판단, 드라이브가 다르면 ValueError → 차단
+        p = os.path.normcase(os.path.realpath(path_str))
+        return os.path.commonpath([p, _HOME_REAL]) == _HOME_REAL
     except Exception:
         return False
 
+# win10toast(pywin32/COM 초기화 포함)는 처음 알림을 띄울 때 한 번만 import
+_toast_cls = None; _toast_tried = False; _toast_lock = threading.Lock()
+def get_toaster():
+    global _toast_cls, _toast_tried
+    if not _toast_tried:
+        with _toast_lock:
+            if not _toast_tried:
+                try:
+                    from win10toast import ToastNotifier
+                    _toast_cls = ToastNotifier
+                except Exception as e:
+                    log_line(f"win10toast unavailable: {e}")
+                _toast_tried = True
+    # 인스턴스는 매번 새로: 하나를 재사용하면 앞 알림이 떠 있는 동안 다음 알림이 무시됨
+    return _toast_cls() if _toast_cls else None
+
 def show_toast(title:str, msg:str, duration:int=6):
     try:
-        if ToastNotifier and platform.system()=="Windows":
-            ToastNotifier().show_toast(title, msg, duration=duration, threaded=True)
+        toaster = get_toaster() if platform.system()=="Windows" else None
+        if toaster:
+            toaster.show_toast(title, msg, duration=duration, threaded=True)
         else:
             log_line(f"[TOAST]{title} | {msg}")
     except Exception as e:
@@ -120,133 +236,276 @@ def ensure_task_scheduler(hour:int):
         log_line(f"schtasks error: {e}"); return False
 
 # ---- NLQ (간단 한국어 자연어) ----
-def parse_nl_query(nlq:str):
-    text = (nlq or '').strip()
-    if not text: return {}
-    now = datetime.now(); d0 = now.replace(hour=0,minute=0,second=0,microsecond=0)
-    def drange(t:str):
-        t2 = t.replace(' ','')
-        if '오늘' in t2: return d0, d0+timedelta(days=1)-timedelta(seconds=1)
-        if '어제' in t2: return d0-timedelta(days=1), d0-timedelta(seconds=1)
-        if '이번주' in t2:
-            s = d0 - timedelta(days=d0.weekday()); return s, s+timedelta(days=7)-timedelta(seconds=1)
-        if '지난주' in t2:
-            s = d0 - timedelta(days=d0.weekday()+7); return s, s+timedelta(days=7)-timedelta(seconds=1)
-        if '이번달' in t2:
-            s = d0.replace(day=1); nm = s.replace(year=s.year+1,month=1) if s.month==12 else s.replace(month=s.month+1)
-            return s, nm-timedelta(seconds=1)
-        if '지난달' in t2:
-            ft = d0.replace(day=1); lp = ft-timedelta(seconds=1)
-            return lp.replace(day=1,hour=0,minute=0,second=0,microsecond=0), lp
-        if '~' in t:
-            a,b = t.split('~',1)
-            try:
-                s = datetime.fromisoformat(a.strip()[:10]+' 00:00:00')
-                e = datetime.fromisoformat(b.strip()[:10]+' 23:59:59'); return s,e
+_EVENTS_MAP={'생성':'created','만들':'created','추가':'created','수정':'modified','변경':'modified',
+             '이동':'moved','옮기':'moved','삭제':'deleted','없어지':'deleted','제거':'deleted'}
+_EVENT_TOKEN_RE=re.compile('|'.join(re.escape(k) for k in _EVENTS_MAP))
+_EXT_SYN={'워드':['.doc','.docx'],'엑셀':['.xls','.xlsx'],'한글':['.hwp'],
+          '파워포인트':['.ppt','.pptx'],'파포':['.ppt','.pptx'],'pdf':['.pdf'],
+          '텍스트':['.txt'],'이미지':['.png','.jpg','.jpeg'],'사진':['.png','.jpg','.jpeg']}
+_EXT_SYN_LOWER={k.lower():v for k,v in _EXT_SYN.items()}
+_PUNCT_TBL=str.maketrans({',':' '})
+_TOKEN_RE=re.compile(r"\S+")
+_DROP_SET=frozenset({'오늘','어제','이번','지난','이번주','지난주','이번달','지난달','파일','확장자','중','포함'})
+
+# 기간 계산은 날짜 서수(date.toordinal) 정수로: (시작일, 끝일) 모두 포함 범위
+def _this_month(d0:date):
+    s = d0.toordinal()-d0.day+1
+    return s, s+calendar.monthrange(d0.year, d0.month)[1]-1
+
+def _last_month(d0:date):
+    e = d0.toordinal()-d0.day  # 지난달 말일
+    y, m = (d0.year-1, 12) if d0.month==1 else (d0.year, d0.month-1)
+    return e-calendar.monthrange(y, m)[1]+1, e
+
+def _week_of(s:int):
+    return s, s+6
+
+# 기간 단어 → (시작일, 끝일) 계산 함수. 위에서부터 먼저 일치하는 것 사용
+_PERIODS={
+    '오늘':   lambda d0: (d0.toordinal(),)*2,
+    '어제':   lambda d0: (d0.toordinal()-1,)*2,
+    '이번주': lambda d0: _week_of(d0.toordinal()-d0.weekday()),
+    '지난주': lambda d0: _week_of(d0.toordinal()-d0.weekday()-7),
+    '이번달': _this_month,
+    '지난달': _last_month,
+}
+
+NLQuery = collections.namedtuple('NLQuery', 'keyword start end event_types extensions')
+_EMPTY_NLQ = NLQuery('', None, None, (), ())
+
+def _nl_date_range(t:str, d0:date):
+    t2 = t.replace(' ','')
+    for word,rng in _PERIODS.items():
+        if word in t2: return rng(d0)
+    if '~' in t:
+        a,b = t.split('~',1)
+        try: return date.fromisoformat(a.strip()[:10]).toordinal(), date.fromisoformat(b.strip()[:10]).toordinal()
+        except: pass
+    for part in t.split():
+        if len(part)>=10 and part[4]=='-' and part[7]=='-':
+            try: s = date.fromisoformat(part[:10]).toordinal(); return s,s
             except: pass
-        for part in t.split():
-            if len(part)>=10 and part[4]=='-' and part[7]=='-':
-                try:
-                    s = datetime.fromisoformat(part[:10]+' 00:00:00')
-                    e = datetime.fromisoformat(part[:10]+' 23:59:59'); return s,e
-                except: pass
-        return None, None
-    events_map = {'생성':'created','만들':'created','추가':'created','수정':'modified','변경':'modified',
-                  '이동':'moved','옮기':'moved','삭제':'deleted','없어지':'deleted','제거':'deleted'}
+    return None, None
+
+def parse_nl_query(nlq:str) -> NLQuery:
+    text = (nlq or '').strip()
+    if not text: return _EMPTY_NLQ
+    # 오늘/어제 등 상대 기간이 자정에 바뀌도록 날짜도 캐시 키에 포함
+    return _parse_nl_query(text, date.today())
+
+# 같은 입력은 캐시된 결과 재사용 (결과는 불변 namedtuple)
+@functools.lru_cache(maxsize=256)
+def _parse_nl_query(text:str, today:date) -> NLQuery:
     event_types=[]
-    for k,v in events_map.items():
+    for k,v in _EVENTS_MAP.items():
         if k in text and v not in event_types: event_types.append(v)
-    ext_syn={'워드':['.doc','.docx'],'엑셀':['.xls','.xlsx'],'한글':['.hwp'],
-            '파워포인트':['.ppt','.pptx'],'파포':['.ppt','.pptx'],'pdf':['.pdf'],
-            '텍스트':['.txt'],'이미지':['.png','.jpg','.jpeg'],'사진':['.png','.jpg','.jpeg']}
-    extensions=[]
-    for tok in text.replace(',',' ').split():
-        if tok.startswith('.') and len(tok)<=6: extensions.append(tok.lower())
+    # 토큰은 한 번만 나눠서 확장자/키워드로 분류
+    extensions=[]; keywords=[]
+    for tok in _TOKEN_RE.findall(text.translate(_PUNCT_TBL)):
+        if tok.startswith('.'):
+            if len(tok)<=6: extensions.append(tok.lower())
+            continue
+        if tok in _DROP_SET or tok.lower() in _EXT_SYN_LOWER: continue
+        if _EVENT_TOKEN_RE.search(tok): continue
+        keywords.append(tok)
     tl=text.lower()
-    for syn,lst in ext_syn.items():
-        if syn.lower() in tl:
+    for syn,lst in _EXT_SYN_LOWER.items():
+        if syn in tl:
             for e in lst:
                 if e not in extensions: extensions.append(e)
-    s,e = drange(text)
-    start = s.isoformat(sep=' ') if s else None
-    end   = e.isoformat(sep=' ') if e else None
-    drop={'오늘','어제','이번','지난','이번주','지난주','이번달','지난달','파일','확장자','중','포함'}
-    keywords=[]
-    for tok in text.replace(',',' ').split():
-        if tok in drop or tok.startswith('.'): continue
-        if any(k in tok for k in events_map.keys()): continue
-        if tok.lower() in ext_syn: continue
-        keywords.append(tok)
-    return {'keyword':' '.join(keywords),'start':start,'end':end,'event_types':event_types,'extensions':extensions}
+    s,e = _nl_date_range(text, today)
+    # event_time 저장 형식(YYYY-MM-DDTHH:MM:SS)과 같게 → 문자열 비교/인덱스 범위 검색이 정확
+    start = date.fromordinal(s).isoformat()+'T00:00:00' if s else None
+    end   = date.fromordinal(e).isoformat()+'T23:59:59' if e else None
+    return NLQuery(' '.join(keywords), start, end, tuple(event_types), tuple(extensions))
 
 # ---------- Watcher ----------
+EVENT_QUEUE_MAX = 10000  # 쓰기 대기 이벤트 상한 (넘치면 가장 오래된 것부터 버림)
+WRITE_BATCH_MAX = 500    # 한 트랜잭션에 저장할 최대 이벤트 수
+DEBOUNCE_SEC = 0.5     # 같은 파일·같은 종류의 이벤트가 이 간격 안에 반복되면 무시
+RECENT_MAX = 4096      # 중복 판단용으로 기억하는 (이벤트, 경로) 최대 개수
+CHECKPOINT_IDLE = 5.0  # 마지막 쓰기 후 이만큼 조용하면 WAL 체크포인트
+MAINTAIN_BATCHES = 100  # 이만큼 배치를 저장할 때마다 WAL 비우기 + 통계 갱신
+LOGGED_EVENTS = frozenset({'created','modified','moved','deleted'})
+NOISY_EXTS = frozenset({'.tmp','.swp','.part','.crdownload'})  # 임시/다운로드 중 파일은 기록 안 함
+POLLING_TIMEOUT = 2.0  # 폴링 감시 시 디렉토리 스캔 주기(초)
+INSERT_EVENT_SQL = "INSERT INTO file_events(file_name,event_time,ext,dir,event_type,src_path,dest_path) VALUES(?,?,?,?,?,?,?)"
+
+_last_sec = (0, "")
+def fmt_event_time(ts:float) -> str:
+    # 초 단위 형식이라 같은 초의 이벤트는 직전 문자열 재사용 (datetime 생성/포맷 생략)
+    global _last_sec
+    t=int(ts); cached=_last_sec
+    if t==cached[0]: return cached[1]
+    s=time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(t)); _last_sec=(t, s)
+    return s
+
+# 이벤트는 큐에 넣기만 하고, DB 저장은 writer 스레드가 write_batch()로 묶어서 처리
 class FSHandler(FileSystemEventHandler):
-    def __init__(self, conn, exts):
-        super().__init__(); self.conn=conn; self.exts={e.lower().strip() for e in exts if e.strip()}
+    def __init__(self, conn, lock, exts):
+        super().__init__(); self.conn=conn; self.write_lock=lock; self.exts=frozenset(e.lower().strip() for e in exts if e.strip())
+        self._filter=bool(self.exts)  # 확장자 필터 미설정이면 포함 검사 생략
+        self.q=queue.Queue(maxsize=EVENT_QUEUE_MAX); self._cur=conn.cursor()
+        # 앱 자신의 DB/WAL/로그 파일 변경은 무시 (기록 → 이벤트 → 기록 되먹임 방지)
+        self._self_prefixes=tuple(os.path.normcase(os.path.realpath(d))+os.sep for d in (DB_DIR, LOG_DIR))
+        self._recent=collections.OrderedDict()
     def _log(self, etype, src=None, dst=None):
         try:
-            p = Path(dst or src); ext=p.suffix.lower()
-            if self.exts and ext not in self.exts: return
-            now = datetime.now().isoformat(timespec='seconds')
-            with self.conn:
-                self.conn.execute(
-                    "INSERT INTO file_events(file_name,event_time,ext,dir,event_type,src_path,dest_path) VALUES(?,?,?,?,?,?,?)",
-                    (p.name, now, ext, str(p.parent), etype, src, dst)
-                )
+            # Path 객체 대신 os.path 문자열 함수만 사용 (이벤트마다 호출되는 경로)
+            path = dst or src; file_name = os.path.basename(path)
+            ext = os.path.splitext(file_name)[1].lower()
+            if self._filter and ext not in self.exts: return
+            if ext in NOISY_EXTS or os.path.normcase(path).startswith(self._self_prefixes): return
+            # 편집기 저장 시 연달아 오는 같은 이벤트는 한 번만 기록
+            key=(etype, path); now=time.monotonic(); last=self._recent.get(key)
+            if last is not None and now-last < DEBOUNCE_SEC: return
+            self._recent[key]=now; self._recent.move_to_end(key)
+            if len(self._recent)>RECENT_MAX: self._recent.popitem(last=False)
+            # 시각은 epoch로만 기록해 두고 문자열 변환은 writer에서 (감시 스레드 부담 최소화)
+            self._enqueue((file_name, time.time(), ext, os.path.dirname(path), etype, src, dst))
         except Exception as e: log_line(f"log error: {e}")
-    def on_created(self, ev):  # type: ignore
-        if getattr(ev,'is_directory',False): return
-        self._log('created', src=ev.src_path)
-    def on_modified(self, ev):
-        if getattr(ev,'is_directory',False): return
-        self._log('modified', src=ev.src_path)
-    def on_moved(self, ev):
-        if getattr(ev,'is_directory',False): return
-        self._log('moved', src=ev.src_path, dst=ev.dest_path)
-    def on_deleted(self, ev):
+    def _enqueue(self, row):
+        try: self.q.put_nowait(row)
+        except queue.Full:
+            try: self.q.get_nowait()
+            except queue.Empty: pass
+            try: self.q.put_nowait(row)
+            except queue.Full: pass
+    def write_batch(self, batch):
+        rows=[(r[0], fmt_event_time(r[1]))+r[2:] for r in batch]
+        try:
+            with self.write_lock, write_txn(self.conn): self._cur.executemany(INSERT_EVENT_SQL, rows)
+        except Exception as e: log_line(f"write error: {e}")
+    def checkpoint(self):
+        try:
+            with self.write_lock: self.conn.execute("PRAGMA wal_checkpoint(PASSIVE);")
+        except Exception as e: log_line(f"checkpoint error: {e}")
+    def maintain(self):
+        try:
+            with self.write_lock:
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE);"); self.conn.execute("PRAGMA optimize;")
+        except Exception as e: log_line(f"maintain error: {e}")
+    # watchdog 기본 dispatch(on_any_event 호출 + 이름으로 on_* 조회) 대신 한 메서드에서 처리
+    def dispatch(self, ev):  # type: ignore
         if getattr(ev,'is_directory',False): return
-        self._log('deleted', src=ev.src_path)
+        et = ev.event_type
+        if et not in LOGGED_EVENTS: return  # opened/closed 등은 기록 안 함
+        if et == 'moved': self._log(et, src=ev.src_path, dst=ev.dest_path)
+        else: self._log(et, src=ev.src_path)
+
+def is_network_path(path_str:str) -> bool:
+    return path_str.startswith('\\\\') or path_str.startswith('//')
 
+# 네트워크(SMB/UNC) 경로는 OS 알림 이벤트가 누락되므로 폴링 감시로 전환
 class MultiWatcher:
-    def __init__(self, paths, exts, conn):
-        self.paths=paths; self.exts=exts; self.conn=conn; self.observer=None
+    def __init__(self, paths, exts, conn, lock, polling=False):
+        self.paths=paths; self.exts=exts; self.conn=conn; self.write_lock=lock; self.observer=None
+        self.polling=polling or any(is_network_path(p) for p in paths)
+        self.handler=None; self._writer=None
     def start(self):
         if Observer is None: raise RuntimeError("watchdog 미설치: py -m pip install watchdog")
         if self.observer: return
-        h=FSHandler(self.conn,self.exts); obs=Observer()
+        h=FSHandler(self.conn,self.write_lock,self.exts)
+        obs=PollingObserver(timeout=POLLING_TIMEOUT) if self.polling else Observer()
         for p in self.paths: obs.schedule(h, p, recursive=True)
-        obs.start(); self.observer=obs
+        obs.start(); self.observer=obs; self.handler=h
+        self._writer=threading.Thread(target=self._writer_loop, name="wa-writer", daemon=True); self._writer.start()
+    # 큐에 쌓인 이벤트를 최대 WRITE_BATCH_MAX개씩 한 트랜잭션으로 저장, None을 받으면 종료
+    def _writer_loop(self):
+        h=self.handler; q=h.q; dirty=False; n=0
+        while True:
+            try: first=q.get(timeout=CHECKPOINT_IDLE)
+            except queue.Empty:
+                if dirty: h.checkpoint(); dirty=False
+                continue
+            if first is None: return
+            batch=[first]; done=False
+            try:
+                while len(batch)<WRITE_BATCH_MAX:
+                    r=q.get_nowait()
+                    if r is None: done=True; break
+                    batch.append(r)
+            except queue.Empty: pass
+            h.write_batch(batch); dirty=True; n+=1
+            if n%MAINTAIN_BATCHES==0: h.maintain(); dirty=False
+            if done: return
     def stop(self):
         if self.observer:
             self.observer.stop(); self.observer.join(timeout=5); self.observer=None
+        # 큐 끝에 None → 남은 이벤트를 모두 저장한 뒤 writer 종료
+        if self._writer:
+            self.handler.q.put(None); self._writer.join(timeout=5); self._writer=None
+        self.handler=None
 
 # ---------- Query / Export ----------
-def to_rows(records):
-    return [[r[0],r[1],r[2],r[3],r[4],r[5]] for r in records]
-
-def search_events(conn, keyword='', start=None, end=None, ext_filter='', event_types=None):
-    q="SELECT id,file_name,event_time,ext,dir,event_type,src_path,dest_path FROM file_events WHERE 1=1"
-    params=[]
+SEARCH_LIMIT = 1000
+PROGRESS_OPS = 10000  # 검색 취소 여부를 확인하는 SQLite VM 명령 간격
+EXPORT_CHUNK = 1000   # CSV 내보내기 시 한 번에 가져올 행 수
+
+# 조건 조합(shape)별 SQL 문자열을 캐시 → 같은 문자열이면 sqlite3가 준비된 statement를 재사용
+_SEARCH_SQL_CACHE = {}
+
+def _in_bucket(n:int) -> int:
+    # IN (...) 목록 길이를 2의 거듭제곱으로 올림 (남는 자리는 NULL로 채움)
+    b=1
+    while b<n: b*=2
+    return b
+
+def _search_sql(shape):
+    q=_SEARCH_SQL_CACHE.get(shape)
+    if q is not None: return q
+    has_fts, n_like, has_start, has_end, n_ext, n_types, incremental = shape
+    clauses=["1=1"]
+    if has_fts: clauses.append("id IN (SELECT rowid FROM file_events_fts WHERE file_events_fts MATCH ?)")
+    clauses+=["(file_name LIKE ? OR dir LIKE ? OR event_type LIKE ?)"]*n_like
+    if has_start and has_end: clauses.append("event_time BETWEEN ? AND ?")
+    elif has_start: clauses.append("event_time >= ?")
+    elif has_end:   clauses.append("event_time <= ?")
+    if n_ext:   clauses.append(f"ext IN ({','.join('?'*n_ext)})")
+    if n_types: clauses.append(f"event_type IN ({','.join('?'*n_types)})")
+    # incremental: 이미 표시한 행 이후에 추가된 것만 (증분 갱신)
+    if incremental: clauses.append("id > ?")
+    order="id DESC" if incremental else "event_time DESC"
+    # 표에 보이는 6개 컬럼만 조회 → 결과 행을 그대로 Treeview에 넣음
+    q=("SELECT id,file_name,event_time,ext,dir,event_type FROM file_events WHERE "
+       + " AND ".join(clauses) + f" ORDER BY {order} LIMIT ? OFFSET ?")
+    _SEARCH_SQL_CACHE[shape]=q
+    return q
+
+# 결과는 커서(반복 가능)로 반환 → 한 페이지(page_size행)만 가져옴
+# extensions: 소문자 '.확장자' 튜플 (문자열 파싱은 호출하는 쪽에서 한 번만)
+def search_events(conn, keyword='', start=None, end=None, extensions: tuple = (), event_types=None, after_id=None,
+                  page=0, page_size=SEARCH_LIMIT):
+    params=[]; fts=[]; rest=[]
     if keyword:
-        q+=" AND (file_name LIKE ? OR dir LIKE ? OR event_type LIKE ?)"
-        k=f"%{keyword}%"; params+=[k,k,k]
-    if start: q+=" AND event_time >= ?"; params.append(start)
-    if end:   q+=" AND event_time <= ?"; params.append(end)
-    if isinstance(ext_filter,(list,tuple)):
-        exts=[e.lower() for e in ext_filter if e]; 
-        if exts:
-            q+=f" AND ext IN ({','.join('?'*len(exts))})"; params+=exts
-    elif ext_filter:
-        q+=" AND ext = ?"; params.append(str(ext_filter).lower())
-    if event_types:
-        q+=f" AND event_type IN ({','.join('?'*len(event_types))})"; params+=event_types
-    q+=" ORDER BY event_time DESC LIMIT 1000"
-    return conn.execute(q, params).fetchall()
+        # 3글자 이상 단어는 FTS 색인으로, 짧은 단어(trigram 불가)는 LIKE로
+        if FTS_ENABLED:
+            toks=keyword.split(); fts=[t for t in toks if len(t)>=FTS_MIN_LEN]; rest=[t for t in toks if len(t)<FTS_MIN_LEN]
+        else:
+            rest=[keyword]
+    if fts: params.append(' '.join('"'+t.replace('"','""')+'"' for t in fts))
+    for t in rest:
+        k=f"%{t}%"; params+=[k,k,k]
+    if start: params.append(start)
+    if end:   params.append(end)
+    exts=list(extensions)
+    n_ext=_in_bucket(len(exts)) if exts else 0; params+=exts+[None]*(n_ext-len(exts))
+    types=list(event_types or ())
+    n_types=_in_bucket(len(types)) if types else 0; params+=types+[None]*(n_types-len(types))
+    if after_id: params.append(after_id)
+    params+=[page_size, page*page_size]
+    shape=(bool(fts), len(rest), bool(start), bool(end), n_ext, n_types, bool(after_id))
+    return conn.execute(_search_sql(shape), params)
 
 def export_csv(conn, path):
     cur = conn.execute("SELECT file_name,event_time,ext,dir,event_type,src_path,dest_path FROM file_events ORDER BY event_time DESC")
-    with open(path,'w',newline='',encoding='utf-8') as f:
-        w=csv.writer(f); w.writerow(["file_name","event_time","ext","dir","event_type","src_path","dest_path"]); w.writerows(cur)
+    cur.arraysize = EXPORT_CHUNK
+    with open(path,'w',newline='',encoding='utf-8',buffering=1<<20) as f:
+        w=csv.writer(f); w.writerow(["file_name","event_time","ext","dir","event_type","src_path","dest_path"])
+        while True:
+            rows=cur.fetchmany()
+            if not rows: break
+            w.writerows(rows)
 
 # ---------- Memo ----------
 def parse_memo(text:str):
@@ -264,11 +523,9 @@ def summarize_memo(text:str):
 
 def save_tasks(conn, indices, text, due_date):
     items=parse_memo(text); now=datetime.now().isoformat(timespec='seconds')
-    with conn:
-        for it in items:
-            if it['idx'] in indices:
-                conn.execute("INSERT INTO tasks(task_text,due_date,status,created_at) VALUES(?,?,?,?)",
-                             (f"#{it['idx']} {it['title']}", due_date,'pending',now))
+    rows=[(f"#{it['idx']} {it['title']}", due_date,'pending',now) for it in items if it['idx'] in indices]
+    with write_txn(conn):
+        conn.executemany("INSERT INTO tasks(task_text,due_date,status,created_at) VALUES(?,?,?,?)", rows)
 
 def get_due_tasks(conn, date_str):
     return conn.execute("SELECT id,task_text FROM tasks WHERE due_date=? AND status='pending' ORDER BY id",(date_str,)).fetchall()
@@ -282,13 +539,9 @@ def check_dirs_permissions(dirs):
         if not is_safe_watch_dir(one): lines_block.append(f"{pref}  [차단] 홈 내부만 허용"); continue
         try: os.listdir(one)
         except Exception as e: lines_warn.append(f"{pref}  [경고] 읽기 오류: {e}"); continue
-        try:
-            p=Path(one)/".wa_perm_test.tmp"
-            with open(p,'w',encoding='utf-8') as f: f.write('ok')
-            try: p.unlink()
-            except: pass
-            lines_ok.append(f"{pref}  [정상] 접근 가능")
-        except Exception as e: lines_warn.append(f"{pref}  [경고] 쓰기 실패: {e}")
+        # 테스트 파일을 만들지 않고 권한만 확인 (감시 중인 폴더에 가짜 이벤트가 생기지 않도록)
+        if os.access(one, os.W_OK): lines_ok.append(f"{pref}  [정상] 접근 가능")
+        else: lines_warn.append(f"{pref}  [경고] 쓰기 권한 없음")
     r=["권한 자가 점검 결과",""]
     if lines_block: r+=["[차단]",*lines_block,""]
     if lines_warn:  r+=["[경고]",*lines_warn,""]
@@ -298,18 +551,30 @@ def check_dirs_permissions(dirs):
 
 # ---------- GUI ----------
 class App(tk.Tk):
-    def __init__(self):
+    def __init__(self, polling=False):
         super().__init__()
         self.title("File Work Logger (tk)")
         self.geometry("1100x720")
         self.minsize(900,600)
 
-        self.conn=db_connect()
-        with self.conn: self.conn.executescript(SCHEMA_SQL)
-        row=self.conn.execute("SELECT watch_dir,extensions,remind_hour FROM settings WHERE id=1").fetchone()
+        self.write_conn=db_connect_writer(); self.write_lock=threading.Lock()
+        init_schema(self.write_conn)
+        self.readers=ReaderPool()
+        row=self.write_conn.execute("SELECT watch_dir,extensions,remind_hour FROM settings WHERE id=1").fetchone()
         self.watch_dir=row[0]; self.extensions=row[1]; self.remind_hour=row[2]
 
         self.watcher=None
+        self.var_polling=tk.BooleanVar(value=polling)
+        self._last_max_id=0; self._last_filter_key=None
+        self._query_gen=0; self._busy_key=None; self._page=0
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # 창이 포커스를 잃거나 최소화되면 자동 새로고침 일시 중지
+        self._active=True
+        self.bind("<FocusIn>",  lambda e: self._set_active(True), add="+")
+        self.bind("<FocusOut>", lambda e: self._set_active(False), add="+")
+        self.bind("<Map>",   lambda e: e.widget is self and self._set_active(True), add="+")
+        self.bind("<Unmap>", lambda e: e.widget is self and self._set_active(False), add="+")
 
         self.create_widgets()
         self.refresh_table()
@@ -317,10 +582,21 @@ class App(tk.Tk):
         # ✅ 자동 새로고침: 3초마다 테이블 갱신
         self.after(3000, self.auto_refresh)
 
-    # 자동 새로고침 루프
+    def on_close(self):
+        # 종료 전 감시 중지 → 큐에 남은 이벤트 저장
+        try:
+            if self.watcher: self.watcher.stop(); self.watcher=None
+        finally:
+            self.destroy()
+
+    def _set_active(self, active:bool):
+        self._active=active
+
+    # 자동 새로고침 루프 (비활성/최소화 상태에서는 DB 조회 생략)
     def auto_refresh(self):
         try:
-            self.refresh_table()
+            if self._active and self.state()!='iconic':
+                self.refresh_table()
         finally:
             self.after(3000, self.auto_refresh)
 
@@ -339,6 +615,7 @@ class App(tk.Tk):
         self.e_ext_all=tk.Entry(top,width=60); self.e_ext_all.grid(row=1,column=1,sticky="w"); self.e_ext_all.insert(0,self.extensions)
         ttk.Button(top,text="감시 시작",command=self.start_watch).grid(row=1,column=2,padx=4)
         ttk.Button(top,text="정지",command=self.stop_watch).grid(row=1,column=3,padx=4)
+        ttk.Checkbutton(top,text="폴링 감시(네트워크 폴더)",variable=self.var_polling).grid(row=1,column=4,columnspan=3,sticky="w",padx=4)
 
         # Search row
         ttk.Label(top,text="검색").grid(row=2,column=0,sticky="w")
@@ -347,7 +624,7 @@ class App(tk.Tk):
         ttk.Label(top,text="종료").grid(row=2,column=4,sticky="e"); self.e_to=tk.Entry(top,width=18); self.e_to.grid(row=2,column=5,sticky="w")
 
         ttk.Label(top,text="필터 확장자").grid(row=2,column=6,sticky="e"); self.e_fext=tk.Entry(top,width=10); self.e_fext.grid(row=2,column=7,sticky="w")
-        ttk.Button(top,text="새로고침",command=self.refresh_table).grid(row=2,column=8,padx=4)
+        ttk.Button(top,text="새로고침",command=lambda: self.refresh_table(force=True)).grid(row=2,column=8,padx=4)
         ttk.Button(top,text="CSV 내보내기",command=self.export_csv_dialog).grid(row=2,column=9,padx=4)
 
         # NLQ row
@@ -356,6 +633,10 @@ class App(tk.Tk):
         self.var_multi=tk.BooleanVar(value=False)
         ttk.Checkbutton(top,text="다중 확장자",variable=self.var_multi, command=self.toggle_multi).grid(row=3,column=6,sticky="w")
         self.e_fexts=tk.Entry(top,width=18, state="disabled"); self.e_fexts.grid(row=3,column=7,sticky="w")
+        pager=ttk.Frame(top); pager.grid(row=3,column=8,columnspan=2,sticky="w",padx=4)
+        ttk.Button(pager,text="◀",width=3,command=lambda: self.move_page(-1)).pack(side="left")
+        self.lbl_page=ttk.Label(pager,text="1쪽",width=6,anchor="center"); self.lbl_page.pack(side="left")
+        ttk.Button(pager,text="▶",width=3,command=lambda: self.move_page(1)).pack(side="left")
 
         # Tree (log)
         cols=("ID","파일명","이벤트시각","확장자","디렉토리","이벤트")
@@ -412,14 +693,14 @@ class App(tk.Tk):
             messagebox.showerror("오류","허용되지 않거나 존재하지 않는 경로:\n"+"\n".join(bad)); return
         exts=[e if e.startswith('.') else ('.'+e if e else '') for e in exts_raw.split(';')]
 
-        with self.conn:
-            self.conn.execute("UPDATE settings SET watch_dir=?, extensions=? WHERE id=1",(d,exts_raw))
+        with self.write_lock, write_txn(self.write_conn):
+            self.write_conn.execute("UPDATE settings SET watch_dir=?, extensions=? WHERE id=1",(d,exts_raw))
 
         try:
             if self.watcher: self.watcher.stop()
-            self.watcher = MultiWatcher(dirs, exts, self.conn)
+            self.watcher = MultiWatcher(dirs, exts, self.write_conn, self.write_lock, polling=self.var_polling.get())
             self.watcher.start()
-            messagebox.showinfo("안내","감시 시작됨")
+            messagebox.showinfo("안내","감시 시작됨"+(" (폴링)" if self.watcher.polling else ""))
         except Exception as e:
             messagebox.showerror("오류","감시 시작 실패: "+str(e))
 
@@ -428,31 +709,81 @@ class App(tk.Tk):
             self.watcher.stop(); self.watcher=None
             messagebox.showinfo("안내","감시 중지됨")
 
-    def refresh_table(self):
-        nl = parse_nl_query(self.e_nlq.get().strip()) if self.e_nlq.get().strip() else {}
+    def refresh_table(self, force=False):
+        nl = parse_nl_query(self.e_nlq.get())
         if self.var_multi.get():
             mult=self.e_fexts.get().strip()
             if mult:
-                ext_filter=[e.lower() if e.startswith('.') else ('.'+e.lower() if e else '') for e in mult.split(';') if e.strip()]
+                exts=tuple(e if e.startswith('.') else '.'+e for e in (x.strip().lower() for x in mult.split(';')) if e)
             else:
-                ext_filter=nl.get('extensions','')
+                exts=nl.extensions
         else:
-            ext_filter=self.e_fext.get().lower().strip() or (nl.get('extensions')[0] if nl.get('extensions') else '')
-
-        start_v=self.e_from.get().strip() or nl.get('start')
-        end_v  =self.e_to.get().strip()   or nl.get('end')
-        keyword=' '.join(x for x in [self.e_search.get().strip(), nl.get('keyword','')] if x)
-
-        rows=search_events(self.conn, keyword=keyword, start=start_v, end=end_v,
-                           ext_filter=ext_filter, event_types=nl.get('event_types'))
-        for i in self.tree.get_children(): self.tree.delete(i)
-        for r in to_rows(rows): self.tree.insert('', 'end', values=r)
+            one=self.e_fext.get().lower().strip()
+            exts=(one,) if one else nl.extensions[:1]
+
+        start_v=normalize_time_bound(self.e_from.get())         or nl.start
+        end_v  =normalize_time_bound(self.e_to.get(), end=True) or nl.end
+        keyword=' '.join(x for x in [self.e_search.get().strip(), nl.keyword] if x)
+
+        event_types=nl.event_types
+
+        # 필터가 그대로면 새로 추가된 행만 가져오고, 바뀌었을 때만 전체 다시 읽기
+        filters=(keyword, start_v, end_v, exts, tuple(event_types or ()))
+        if self._last_filter_key and filters!=self._last_filter_key[0]: self._page=0  # 조건이 바뀌면 첫 페이지로
+        key=(filters, self._page)
+        if not force and key==self._busy_key: return   # 같은 조건의 조회가 아직 진행 중
+        if not force and key==self._last_filter_key and self._page>0: return  # 이전 페이지를 보는 중엔 자동 갱신 안 함
+        incremental = not force and key==self._last_filter_key
+        args=dict(keyword=keyword, start=start_v, end=end_v, extensions=exts, event_types=event_types,
+                  after_id=self._last_max_id if incremental else None, page=self._page)
+        self._query_gen+=1; self._busy_key=key
+        threading.Thread(target=self._query_worker, args=(self._query_gen, key, incremental, args), daemon=True).start()
+
+    # 검색은 작업 스레드에서 (느린 쿼리가 UI를 멈추지 않도록), 결과 반영은 메인루프에서
+    def _query_worker(self, gen, key, incremental, args):
+        rows=None
+        try:
+            if gen==self._query_gen:
+                with self.readers.borrow() as conn:
+                    # 새 조회가 시작되면 진행 중인 이 조회는 중단 (VM 명령 N개마다 확인)
+                    conn.set_progress_handler(lambda: gen!=self._query_gen, PROGRESS_OPS)
+                    try: rows=list(search_events(conn, **args))
+                    finally: conn.set_progress_handler(None, 0)
+        except sqlite3.OperationalError as e:
+            if 'interrupt' not in str(e): log_line(f"search error: {e}")
+        except Exception as e:
+            log_line(f"search error: {e}")
+        try: self.after_idle(self._populate_tree, gen, key, incremental, rows)
+        except Exception: pass  # 창이 이미 닫힘
+
+    def move_page(self, delta:int):
+        if delta>0 and len(self.tree.get_children())<SEARCH_LIMIT: return  # 마지막 페이지
+        if self._page+delta<0: return
+        self._page+=delta; self.refresh_table(force=True)
+
+    def _populate_tree(self, gen, key, incremental, rows):
+        if gen!=self._query_gen: return  # 더 새로운 조회가 있으면 결과 버림
+        self._busy_key=None
+        if rows is None: return
+        self.lbl_page.config(text=f"{key[1]+1}쪽")
+        if incremental:
+            if not rows: return
+            for r in reversed(rows): self.tree.insert('', 0, iid=str(r[0]), values=r)
+            extra=self.tree.get_children()[SEARCH_LIMIT:]
+            if extra: self.tree.delete(*extra)
+        else:
+            self.tree.delete(*self.tree.get_children())
+            # iid=이벤트 id → 이후 증분 갱신에서 행을 id로 바로 찾을 수 있음
+            for r in rows: self.tree.insert('', 'end', iid=str(r[0]), values=r)
+            self._last_filter_key=key; self._last_max_id=0
+        if rows: self._last_max_id=max(self._last_max_id, max(r[0] for r in rows))
 
     def export_csv_dialog(self):
         path=filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv")])
         if not path: return
         try:
-            export_csv(self.conn, path); messagebox.showinfo("안내","내보내기 완료")
+            with self.readers.borrow() as conn: export_csv(conn, path)
+            messagebox.showinfo("안내","내보내기 완료")
         except Exception as e:
             messagebox.showerror("오류","내보내기 실패: "+str(e))
 
@@ -483,14 +814,14 @@ class App(tk.Tk):
         def do_save():
             indices=[k for k,v in vars_map.items() if v.get()]
             if not indices: messagebox.showwarning("경고","선택된 항목이 없습니다."); return
-            save_tasks(self.conn, indices, self.t_memo.get("1.0",tk.END), due_dt.strftime('%Y-%m-%d'))
+            with self.write_lock: save_tasks(self.write_conn, indices, self.t_memo.get("1.0",tk.END), due_dt.strftime('%Y-%m-%d'))
             messagebox.showinfo("안내","미처리건 저장됨"); sel_win.destroy()
         ttk.Button(btnbar,text="저장",command=do_save).pack(side="right")
         ttk.Button(btnbar,text="닫기",command=sel_win.destroy).pack(side="right",padx=4)
 
     def test_today(self):
         today=datetime.now().strftime('%Y-%m-%d')
-        tasks=get_due_tasks(self.conn,today)
+        with self.readers.borrow() as conn: tasks=get_due_tasks(conn,today)
         if not tasks: show_toast("오늘의 미처리건","미처리건이 없습니다")
         else: show_toast("오늘의 미처리건","\n".join(t[1] for t in tasks))
 
@@ -498,13 +829,13 @@ class App(tk.Tk):
         try:
             hour=int(self.e_rhour.get().strip() or self.remind_hour)
         except: hour=self.remind_hour
-        with self.conn: self.conn.execute("UPDATE settings SET remind_hour=? WHERE id=1",(hour,))
+        with self.write_lock, write_txn(self.write_conn): self.write_conn.execute("UPDATE settings SET remind_hour=? WHERE id=1",(hour,))
         ok=ensure_task_scheduler(hour)
         messagebox.showinfo("안내","매일 알림 예약 완료" if ok else "스케줄 등록 실패(Windows 전용)")
 
 # ---------- Reminder mode ----------
 def reminder_mode():
-    conn=db_connect()
+    conn=db_connect_reader()
     today=datetime.now().strftime('%Y-%m-%d')
     tasks=get_due_tasks(conn,today)
     if not tasks: show_toast("오늘의 미처리건","미처리건이 없습니다. 좋은 하루!")
@@ -515,10 +846,11 @@ def main():
     try:
         parser=argparse.ArgumentParser()
         parser.add_argument('--remind',action='store_true')
+        parser.add_argument('--polling',action='store_true',help='watchdog 폴링 감시 사용 (네트워크 폴더용)')
         args=parser.parse_args()
         if args.remind:
             reminder_mode(); return
-        app=App(); app.mainloop()
+        app=App(polling=args.polling); app.mainloop()
     except Exception as e:
         tb=traceback.format_exc()
         log_line("FATAL:\n"+tb)